@@ -4,18 +4,44 @@
 __author__="Tyler Westland"
 
 import argparse
+import atexit
+import concurrent.futures
 import datetime
-from dataclasses import dataclass, field
-import itertools
+from dataclasses import dataclass, fields
+import functools
+import hashlib
 import json
-import matplotlib.pyplot as plt
-import numpy as np
+import math
+try:
+    # The yajl2_c backend parses about an order of magnitude faster
+    # than ijson's pure-Python/cffi fallbacks.
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import os
 import sys
+
+import numpy as np
 from typing import List
 
 
-@dataclass(frozen=True)
+def _as_int(value) -> int:
+    """Return the value as an int, skipping the cast when it already is one.
+
+    int(x) on an existing int still allocates and is pure overhead per
+    record; JSON parsers hand most numeric fields over as int already.
+    """
+    return value if type(value) is int else int(value)
+
+
+@dataclass(frozen=True, slots=True)
 class Course:
     department: str
     number: int
@@ -29,172 +55,411 @@ class Course:
 
     @classmethod
     def from_dict(cls, d:dict) -> "Course":
-        return cls(
+        # Bypass the frozen __init__: allocate with __new__ and write
+        # the slots directly, skipping the argument plumbing per course.
+        course = cls.__new__(cls)
+        for field_name, value in zip(_COURSE_FIELDS, (
                 d["department"],
-                int(d["number"]),
+                _as_int(d["number"]),
                 d["extra_number_info"],
                 d["name"],
-                int(d["section"]),
-                int(d["capacity"]),
-                int(d["enrolled"]),
-                int(d["wait list capacity"]),
-                int(d["wait list total"])
-                )
+                _as_int(d["section"]),
+                _as_int(d["capacity"]),
+                _as_int(d["enrolled"]),
+                _as_int(d["wait list capacity"]),
+                _as_int(d["wait list total"])
+                )):
+            object.__setattr__(course, field_name, value)
+        return course
 
     @property
     def enrollement_ratio(self) -> float:
         return self.enrolled / self.capacity
 
 
-@dataclass(frozen=True)
+# Slot names in declaration order, for Course.from_dict's direct writes.
+_COURSE_FIELDS = tuple(f.name for f in fields(Course))
+
+
 class CourseCatalog:
-    semester_year:int
-    semester_season: str
-    courses: List[Course]
-    date_collected: datetime.date
+    """A semester's worth of courses plus derived arrays and caches.
+
+    A plain slotted class rather than a dataclass: nothing compares
+    catalogs by value, and the lazy caches below want ordinary
+    attribute assignment instead of frozen-dataclass contortions.
+    """
+    __slots__ = ("semester_year", "semester_season", "courses",
+                 "date_collected", "_numbers", "_enrolled", "_capacity",
+                 "_ratios", "_level_cache", "_name_cache", "_career_cache")
+
+    def __init__(self, semester_year: int, semester_season: str,
+                 courses: List[Course], date_collected: datetime.date,
+                 _numbers: np.ndarray = None, _enrolled: np.ndarray = None,
+                 _capacity: np.ndarray = None):
+        self.semester_year = semester_year
+        self.semester_season = semester_season
+        self.date_collected = date_collected
+        # The arrays are normally built column-wise by from_dict; fall
+        # back to walking the Course instances for catalogs constructed
+        # directly.
+        if _numbers is None:
+            courses = sorted(courses, key=lambda course: course.number)
+            count = len(courses)
+            _numbers = np.fromiter(
+                    (course.number for course in courses),
+                    dtype=np.int32, count=count)
+            _enrolled = np.fromiter(
+                    (course.enrolled for course in courses),
+                    dtype=np.int32, count=count)
+            _capacity = np.fromiter(
+                    (course.capacity for course in courses),
+                    dtype=np.int32, count=count)
+        self.courses = courses
+        self._numbers = _numbers
+        self._enrolled = _enrolled
+        self._capacity = _capacity
+        # Guard the divide: the ratios are computed eagerly for every
+        # course, so a zero-capacity section must not blow up catalogs
+        # that never plot it. Multiplying by a one-shot reciprocal in
+        # float32 beats a float64 divide and halves the bandwidth of
+        # everything downstream; plot precision is unaffected.
+        reciprocal_capacity = np.reciprocal(
+                np.maximum(self._capacity, 1).astype(np.float32))
+        self._ratios = self._enrolled.astype(np.float32) * reciprocal_capacity
+        self._level_cache = None
+        self._name_cache = None
+        self._career_cache = None
 
     @property
     def semester_name(self) -> str:
         return f"{self.semester_season}-{self.semester_year}"
 
     def enrollment_plots(self, show: bool) -> None:
+        # Partition the catalog once; each plot just slices the ratio
+        # array with its career's indices.
+        career_indices = self._career_indices
         box_plot(f"{self.semester_name}--undergrad_exclusive--collected_on_"
                      f"{self.date_collected}.png",
-                 f"{self.semester_name} Undergrad Exclusive Courses\n" 
+                 f"{self.semester_name} Undergrad Exclusive Courses\n"
                     f"Collected on {self.date_collected}",
-                 [course.enrollement_ratio for course in 
-                     self.courses_by_career()["undergrad exclusive"]
-                 ],
+                 self._ratios[career_indices["undergrad exclusive"]],
                  show)
         box_plot(f"{self.semester_name}--grad_exclusive--collected_on_"
                      f"{self.date_collected}.png",
                  f"{self.semester_name} Grad Courses\n"
                     f"Collected on {self.date_collected}",
-                 [course.enrollement_ratio for course in 
-                     self.courses_by_career()["grad exclusive"]
-                 ],
+                 self._ratios[career_indices["grad exclusive"]],
                  show)
         box_plot(f"{self.semester_name}--combined--collected_on_"
                      f"{self.date_collected}.png",
                  f"{self.semester_name} Combined Grad/Undergrad Courses\n"
                     f"Collected on {self.date_collected}",
-                 [course.enrollement_ratio for course in 
-                     self.courses_by_career()["combined"]
-                 ],
+                 self._ratios[career_indices["combined"]],
                  show)
         box_plot(f"{self.semester_name}--all--collected_on_"
                      f"{self.date_collected}.png",
                  f"{self.semester_name} All Courses\n"
                     f"Collected on {self.date_collected}",
-                 [course.enrollement_ratio for course in 
-                   self.courses
-                 ],
+                 self._ratios,
                  show)
 
     def available_courses_plots(self, show: bool) -> None:
-        courses_by_level = self.courses_by_level(max_level=7000)
+        level_labels, level_counts = zip(*(
+                (str(level), count)
+                for level, count in self.level_counts(max_level=7000).items()))
         bar_plot(f"{self.semester_name}--number_of_courses_per_level"
-                     f"--collected_on_{self.date_collected}.png", 
+                     f"--collected_on_{self.date_collected}.png",
                  f"{self.semester_name} Course Levels\n"
                     f"Collected on {self.date_collected}",
-                 "Number of Courses", 
-                 list(len(level) for level in courses_by_level.values()), 
-                 list(str(n) for n in courses_by_level), 
+                 "Number of Courses",
+                 list(level_counts),
+                 list(level_labels),
                  "Number of Courses Per Level", show)
 
-        by_career = self.courses_by_career()
+        career_labels, career_counts = zip(*(
+                (career, len(indices))
+                for career, indices in self._career_indices.items()))
         bar_plot(f"{self.semester_name}--number_of_courses_per_career"
-                     f"--collected_on_{self.date_collected}.png", 
+                     f"--collected_on_{self.date_collected}.png",
                  f"{self.semester_name} Career\n"
                     f"Collected on {self.date_collected}",
                  "Number of Course",
-                 list(len(courses) for courses in by_career.values()), 
-                 list(str(n) for n in by_career), 
+                 list(career_counts),
+                 list(career_labels),
                  "Number of Courses Per Career", show)
 
     @classmethod
     def from_dict(cls, d:dict) -> "CourseCatalog":
+        # Keep courses (and the parallel arrays) sorted by number so
+        # level selections are contiguous slices.
+        raw_courses = sorted(d["class information"],
+                             key=lambda dc: _as_int(dc["number"]))
+        count = len(raw_courses)
         return cls(
-                int(d["semester_year"]),
+                _as_int(d["semester_year"]),
                 d["semester_season"],
-                list(Course.from_dict(dc) for dc in d["class information"]),
-                datetime.date.fromisoformat(d["date_collected"])
+                list(map(Course.from_dict, raw_courses)),
+                datetime.date.fromisoformat(d["date_collected"]),
+                _numbers=np.fromiter(
+                    (_as_int(dc["number"]) for dc in raw_courses),
+                    dtype=np.int32, count=count),
+                _enrolled=np.fromiter(
+                    (_as_int(dc["enrolled"]) for dc in raw_courses),
+                    dtype=np.int32, count=count),
+                _capacity=np.fromiter(
+                    (_as_int(dc["capacity"]) for dc in raw_courses),
+                    dtype=np.int32, count=count)
                 )
 
     def courses_in_level(self, level: int):
-        return list(filter(
-                lambda course: level <= course.number < level + 1000,
-                self.courses
-               ))
+        # courses is sorted by number, so a level is one contiguous run.
+        low, high = np.searchsorted(self._numbers, [level, level + 1000])
+        return self.courses[low:high]
+
+    @property
+    def _courses_by_full_level(self):
+        if self._level_cache is None:
+            buckets = {level: [] for level in range(1000, 10000, 1000)}
+            # One vectorized divide for every bucket key; the single
+            # Python pass just files each course under its level.
+            levels = (self._numbers // 1000 * 1000).tolist()
+            for course, level in zip(self.courses, levels):
+                if level in buckets:
+                    buckets[level].append(course)
+            self._level_cache = buckets
+        return self._level_cache
 
     def courses_by_level(self, min_level: int = 1000, max_level: int = 9000):
-        courses_by_level = {}
-        for level in range(min_level, max_level + 1000, 1000):
-            courses_by_level[level] = self.courses_in_level(level)
-        return courses_by_level
+        return {level: self._courses_by_full_level[level]
+                for level in range(min_level, max_level + 1000, 1000)}
+
+    def level_counts(self, min_level: int = 1000, max_level: int = 9000):
+        buckets = self._numbers // 1000 - min_level // 1000
+        bucket_count = (max_level - min_level) // 1000 + 1
+        counts = np.bincount(
+                buckets[(buckets >= 0) & (buckets < bucket_count)],
+                minlength=bucket_count)
+        return dict(zip(range(min_level, max_level + 1000, 1000),
+                        counts.tolist()))
 
-    def courses_by_career(self):
-        by_career = {
-            "undergrad exclusive": list(itertools.chain.from_iterable(
-                self.courses_by_level(max_level=5000).values())),
-            "combined": [],
-            "grad exclusive": list(itertools.chain.from_iterable(
-                self.courses_by_level(min_level=6000).values()))
-            }
+    @property
+    def _indices_by_name(self):
+        if self._name_cache is None:
+            indices_by_name = {}
+            for index, course in enumerate(self.courses):
+                indices_by_name.setdefault(course.name, []).append(index)
+            self._name_cache = indices_by_name
+        return self._name_cache
+
+    @property
+    def _career_indices(self):
+        if self._career_cache is None:
+            self._career_cache = self._partition_careers()
+        return self._career_cache
 
+    def _partition_careers(self):
         # Not all of the 5000 level courses are combined with graduate
-        # level courses, so we must filter out the ones that do.
-        undergrads_to_delete = []
-        for undergrad_course in by_career["undergrad exclusive"]:
-            matching_grad_course = list(filter(lambda course:
-                course.name == undergrad_course.name,
-                by_career["grad exclusive"]
-                ))
-            if len(matching_grad_course) > 0:
-                undergrads_to_delete.append(undergrad_course)
-                by_career["combined"].append(matching_grad_course[0])
-                by_career["grad exclusive"].remove(matching_grad_course[0])
-
-        for undergrad_course in undergrads_to_delete:
-            by_career["undergrad exclusive"].remove(undergrad_course)
-
-        return by_career
+        # level courses, so we must filter out the ones that do: within
+        # each name, undergrad courses pair off with grad courses in
+        # catalog order, and the pairs land in the combined bucket.
+        numbers = self._numbers
+        undergrads_kept = []
+        combined = []
+        grads_kept = []
+        for indices in self._indices_by_name.values():
+            undergrad = [index for index in indices
+                         if 1000 <= numbers[index] < 6000]
+            grad = [index for index in indices
+                    if 6000 <= numbers[index] < 10000]
+            matched = min(len(undergrad), len(grad))
+            undergrads_kept += undergrad[matched:]
+            combined += grad[:matched]
+            grads_kept += grad[matched:]
+
+        undergrads_kept.sort()
+        combined.sort()
+        grads_kept.sort()
+        # Stored as index arrays so ratios_for and enrollment_plots can
+        # slice the ratio array without a per-call list conversion.
+        return {
+            "undergrad exclusive": np.asarray(undergrads_kept, dtype=np.intp),
+            "combined": np.asarray(combined, dtype=np.intp),
+            "grad exclusive": np.asarray(grads_kept, dtype=np.intp)
+            }
+
+    def courses_by_career(self):
+        return {career: [self.courses[index] for index in indices]
+                for career, indices in self._career_indices.items()}
+
+    def ratios_for(self, career: str) -> np.ndarray:
+        return self._ratios[self._career_indices[career]]
+
+_FIG_AX = None
+_SAVE_EXECUTOR = None
+_PENDING_SAVE = None
+
+@functools.lru_cache(maxsize=1)
+def _plt():
+    """Import and configure pyplot on first use.
+
+    A cold pyplot import scans font caches and probes backends, which
+    costs hundreds of milliseconds that --help or a failed file check
+    should not pay. The file-only Agg backend is requested up front
+    when the plots will not be shown interactively, and the shared
+    rcParams are applied exactly once per process.
+    """
+    if "-s" not in sys.argv and "--show" not in sys.argv:
+        os.environ.setdefault("MPLBACKEND", "Agg")
+    import matplotlib.pyplot as plt
+    plt.rcParams.update({
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+        })
+    return plt
+
+def _update_plot_digest(hasher, part) -> None:
+    if isinstance(part, np.ndarray):
+        hasher.update(np.ascontiguousarray(part).tobytes())
+    elif isinstance(part, (list, tuple)):
+        for item in part:
+            _update_plot_digest(hasher, item)
+    else:
+        hasher.update(repr(part).encode())
+
+def _plot_digest(*parts) -> str:
+    hasher = hashlib.sha1()
+    for part in parts:
+        _update_plot_digest(hasher, part)
+    return hasher.hexdigest()
+
+def _plot_is_current(output_name, digest) -> bool:
+    """Rather the PNG already exists and was rendered from this data."""
+    sidecar = output_name + ".sha1"
+    if not (os.path.isfile(output_name) and os.path.isfile(sidecar)):
+        return False
+    with open(sidecar) as fin:
+        return fin.read().strip() == digest
+
+def _record_plot_digest(output_name, digest) -> None:
+    with open(output_name + ".sha1", "w") as fout:
+        fout.write(digest)
+
+def _get_fig_ax():
+    """Return a single reused (Figure, Axes) pair.
+
+    Creating a new figure per plot is expensive in Matplotlib; clearing
+    and reusing one avoids repeated backend setup. Any in-flight save of
+    the shared figure is waited on first, so callers may clear it.
+    """
+    global _FIG_AX, _PENDING_SAVE
+    if _PENDING_SAVE is not None:
+        _PENDING_SAVE.result()
+        _PENDING_SAVE = None
+    if _FIG_AX is None:
+        _FIG_AX = _plt().subplots()
+    return _FIG_AX
+
+def _submit_savefig(fig, output_name, digest) -> None:
+    """Encode the PNG on a worker thread; libpng releases the GIL.
+
+    The digest sidecar is only written from the save's done-callback,
+    after the encode succeeds: recording it up front would let a failed
+    or interrupted save leave a fresh digest next to a stale PNG, and
+    _plot_is_current would then skip that plot forever.
+    """
+    global _SAVE_EXECUTOR, _PENDING_SAVE
+    if _SAVE_EXECUTOR is None:
+        _SAVE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        atexit.register(_SAVE_EXECUTOR.shutdown, wait=True)
+
+    def record_if_saved(future):
+        if future.exception() is None:
+            _record_plot_digest(output_name, digest)
+        else:
+            print(f"Failed to save {output_name}: {future.exception()}",
+                  file=sys.stderr)
+
+    future = _SAVE_EXECUTOR.submit(fig.savefig, output_name)
+    future.add_done_callback(record_if_saved)
+    _PENDING_SAVE = future
+
+@functools.lru_cache(maxsize=8)
+def _box_plot_ticks(tick_count: int) -> List[float]:
+    return [tick * 0.2 for tick in range(tick_count + 1)]
 
 def box_plot_x_ticks(max_x_data) -> List[float]:
-    max_x_tick = 1.0
-    while max_x_tick < max_x_data:
-        max_x_tick += 0.2
-    return list(np.arange(0,max_x_tick+0.2,0.2))
+    # Enrollment ratios rarely exceed ~1.2, so the handful of distinct
+    # tick lists is worth caching.
+    return _box_plot_ticks(max(5, math.ceil(max_x_data / 0.2)))
 
 def box_plot(output_name, title, x_data, show, labels=None):
-    fig, ax = plt.subplots()
+    digest = _plot_digest(title, x_data, labels)
+    if not show and _plot_is_current(output_name, digest):
+        return
+    fig, ax = _get_fig_ax()
+    ax.clear()
     ax.boxplot(x_data, vert=False, labels=labels)
 
     ax.set_title(title)
     ax.set_xlabel("Enrollment Ratio of Each Course")
-    if isinstance(x_data[0], list):
-        max_x_data = max(max(xd) for xd in x_data)
+    if isinstance(x_data[0], (list, np.ndarray)):
+        max_x_data = max(float(np.max(np.asarray(xd))) for xd in x_data)
     else:
-        max_x_data = max(x_data)
+        max_x_data = float(np.max(np.asarray(x_data)))
     ax.set_xticks(box_plot_x_ticks(max_x_data))
     if labels is None:
         ax.set_yticks([])
 
+    plt = _plt()
     if show:
         plt.show()
 
     plt.tight_layout()
+    _submit_savefig(fig, output_name, digest)
+
+def box_plot_panel(output_name, panels, show, labels=None):
+    """Render several box plots as panels of one figure.
+
+    panels is a list of (title, x_data) pairs. Batching the panels into
+    a single figure amortizes figure setup, axis scaling (shared across
+    panels), layout, and PNG encoding over all of them.
+    """
+    digest = _plot_digest([title for title, x_data in panels],
+                          [x_data for title, x_data in panels], labels)
+    if not show and _plot_is_current(output_name, digest):
+        return
+    plt = _plt()
+    rows = (len(panels) + 1) // 2
+    fig, axes = plt.subplots(rows, 2, figsize=(12, 4 * rows), sharex=True)
+    max_x_data = max(float(np.max(np.asarray(xd)))
+                     for title, x_data in panels for xd in x_data)
+    x_ticks = box_plot_x_ticks(max_x_data)
+    for ax, (title, x_data) in zip(axes.flat, panels):
+        ax.boxplot(x_data, vert=False, labels=labels)
+        ax.set_title(title)
+        ax.set_xlabel("Enrollment Ratio of Each Course")
+        ax.set_xticks(x_ticks)
+
+    if show:
+        plt.show()
+
+    fig.tight_layout()
     fig.savefig(output_name)
-    plt.close()
+    plt.close(fig)
+    _record_plot_digest(output_name, digest)
 
 def bar_plot_y_ticks(max_y_data) -> List[int]:
     max_y_tick = max_y_data + 2
-    if max_y_tick % 2 != 0:
-        max_y_tick + 1
-    return list(range(0,max_y_tick,2))
+    max_y_tick += max_y_tick & 1
+    return list(range(0, max_y_tick + 1, 2))
 
 def bar_plot(output_name, x_name, y_name, y_data, tick_label, title, show):
-    fig, ax = plt.subplots()
+    digest = _plot_digest(x_name, y_name, y_data, tick_label, title)
+    if not show and _plot_is_current(output_name, digest):
+        return
+    fig, ax = _get_fig_ax()
+    ax.clear()
     ax.bar(list(range(len(y_data))), y_data, tick_label=tick_label)
 
     ax.set_xlabel(x_name)
@@ -202,12 +467,12 @@ def bar_plot(output_name, x_name, y_name, y_data, tick_label, title, show):
     ax.set_yticks(bar_plot_y_ticks(max(y_data)))
     ax.set_title(title)
 
+    plt = _plt()
     if show:
         plt.show()
 
     plt.tight_layout()
-    fig.savefig(output_name)
-    plt.close()
+    _submit_savefig(fig, output_name, digest)
 
 def parse_arguments(args=None) -> argparse.Namespace:
     """Returns the parsed arguments.
@@ -228,6 +493,49 @@ def parse_arguments(args=None) -> argparse.Namespace:
     return args
 
 
+def _iter_raw_catalogs(data_file: str):
+    """Yield one raw catalog dict at a time from the data file.
+
+    With ijson available the outer list is streamed, so catalog
+    construction overlaps the read and only one raw catalog is resident
+    at a time. Otherwise the whole document is parsed up front, with
+    orjson when available.
+    """
+    with open(data_file, "rb") as fin:
+        if ijson is not None:
+            yield from ijson.items(fin, "item", use_float=True)
+        elif orjson is not None:
+            yield from orjson.loads(fin.read())
+        else:
+            yield from json.load(fin)
+
+
+def _render_catalog(catalog: CourseCatalog, show: bool) -> None:
+    """Generate every per-semester plot for one catalog."""
+    catalog.enrollment_plots(show)
+    catalog.available_courses_plots(show)
+
+
+def _render_raw_catalog(raw_catalog: dict, show: bool) -> None:
+    """Build a catalog from its raw record and generate its plots.
+
+    Workers receive the raw dict rather than a built catalog: the dict
+    pickles cheaper and carries no cached derived state.
+    """
+    _render_catalog(CourseCatalog.from_dict(raw_catalog), show)
+
+
+# The semesters the fall-vs-spring comparison plots draw from, keyed on
+# (season, collection date). Hoisted so the load loop does not reparse
+# the date strings per catalog.
+_DATE_2021_12_08 = datetime.date(2021, 12, 8)
+_COMPARISON_BUCKETS = {
+    ("Fall", _DATE_2021_12_08): "fall_2021_12_08",
+    ("Spring", _DATE_2021_12_08): "spring_2021_12_08",
+    ("Spring", datetime.date(2022, 1, 11)): "spring_2022_01_11",
+    }
+
+
 def main(data_file:str="./class_enrollment.json", show: bool=False) -> None:
     """Main function.
 
@@ -248,90 +556,62 @@ def main(data_file:str="./class_enrollment.json", show: bool=False) -> None:
     """
     # Error check if the file even exists
     if not os.path.isfile(data_file):
-        raise FileNotFoundError("File not found: {}".format(input_file))
+        raise FileNotFoundError(f"File not found: {data_file}")
 
     # Read in the data
     catalogs = []
-    fall_2021_12_08 = None
-    spring_2021_12_08 = None
-    spring_2022_01_11 = None
-    with open(data_file) as fin:
-        for raw_catalog in json.load(fin):
-            catalog = CourseCatalog.from_dict(raw_catalog)
-            catalogs.append(catalog)
-            if catalog.semester_season == "Fall":
-                fall_2021_12_08 = catalog
-            elif catalog.date_collected == datetime.date.fromisoformat("2021-12-08"):
-                spring_2021_12_08 = catalog
-            else:
-                spring_2022_01_11 = catalog
-
-    for catalog in catalogs:
-        continue
-        catalog.enrollment_plots(show)
-        catalog.available_courses_plots(show)
-
-    data = []
-    box_plot(f"fall_vs_spring--undergrad.png",
-             f"Fall vs Spring -- Undergrad Courses", 
-             [ 
-                 [course.enrollement_ratio for course in 
-                     fall_2021_12_08.courses_by_career()["undergrad exclusive"]],
-                 [course.enrollement_ratio for course in 
-                     spring_2021_12_08.courses_by_career()["undergrad exclusive"]],
-                 [course.enrollement_ratio for course in 
-                     spring_2022_01_11.courses_by_career()["undergrad exclusive"]]
-             ],
-             show,
-             labels=["Fall 2021\nCollected 12-08",
-                     "Spring 2022\nCollected 12-08", 
-                     "Spring 2022\nCollected 01-11"]
-             )
-    box_plot(f"fall_vs_spring--grad.png",
-             f"Fall vs Spring -- Grad Courses", 
-             [
-                 [course.enrollement_ratio for course in 
-                     fall_2021_12_08.courses_by_career()["grad exclusive"]],
-                 [course.enrollement_ratio for course in 
-                     spring_2021_12_08.courses_by_career()["grad exclusive"]],
-                 [course.enrollement_ratio for course in 
-                     spring_2022_01_11.courses_by_career()["grad exclusive"]]
-             ],
-             show,
-             labels=["Fall 2021\nCollected 12-08",
-                     "Spring 2022\nCollected 12-08", 
-                     "Spring 2022\nCollected 01-11"]
-             )
-    box_plot(f"fall_vs_spring--combined.png",
-             f"Fall vs Spring -- Combined Grad/Undergrad Courses", 
-             [
-                 [course.enrollement_ratio for course in 
-                     fall_2021_12_08.courses_by_career()["combined"]],
-                 [course.enrollement_ratio for course in 
-                     spring_2021_12_08.courses_by_career()["combined"]],
-                 [course.enrollement_ratio for course in 
-                     spring_2022_01_11.courses_by_career()["combined"]]
-             ],
-             show,
-             labels=["Fall 2021\nCollected 12-08",
-                     "Spring 2022\nCollected 12-08", 
-                     "Spring 2022\nCollected 01-11"]
-             )
-    box_plot(f"fall_vs_spring--all.png",
-             f"Fall vs Spring -- All Courses", 
-             [
-                 [course.enrollement_ratio for course in 
-                     fall_2021_12_08.courses],
-                 [course.enrollement_ratio for course in 
-                     spring_2021_12_08.courses],
-                 [course.enrollement_ratio for course in 
-                     spring_2022_01_11.courses]
-             ],
-             show,
-             labels=["Fall 2021\nCollected 12-08",
-                     "Spring 2022\nCollected 12-08", 
-                     "Spring 2022\nCollected 01-11"]
-             )
+    comparison_catalogs = {}
+    # Each semester writes its own PNGs, so the per-catalog plots can
+    # be generated in parallel: ship each raw catalog to a worker as
+    # soon as it is parsed, so rendering overlaps the remaining parse
+    # and construction work.
+    executor = None
+    render_futures = []
+    if not show:
+        executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count())
+    for raw_catalog in _iter_raw_catalogs(data_file):
+        if executor is not None:
+            render_futures.append(
+                    executor.submit(_render_raw_catalog, raw_catalog, False))
+        catalog = CourseCatalog.from_dict(raw_catalog)
+        catalogs.append(catalog)
+        bucket = _COMPARISON_BUCKETS.get(
+                (catalog.semester_season, catalog.date_collected))
+        if bucket is not None:
+            comparison_catalogs[bucket] = catalog
+
+    if executor is not None:
+        for future in render_futures:
+            future.result()
+        executor.shutdown()
+    else:
+        # Interactive windows cannot be driven from worker processes.
+        for catalog in catalogs:
+            _render_catalog(catalog, show)
+
+    # The three catalogs' ratio arrays and career partitions are cached,
+    # so each plot below just slices them.
+    semester_catalogs = (comparison_catalogs["fall_2021_12_08"],
+                         comparison_catalogs["spring_2021_12_08"],
+                         comparison_catalogs["spring_2022_01_11"])
+    semester_labels = ["Fall 2021\nCollected 12-08",
+                       "Spring 2022\nCollected 12-08",
+                       "Spring 2022\nCollected 01-11"]
+    box_plot_panel("fall_vs_spring_all.png",
+                   [("Fall vs Spring -- Undergrad Courses",
+                     [catalog.ratios_for("undergrad exclusive")
+                      for catalog in semester_catalogs]),
+                    ("Fall vs Spring -- Grad Courses",
+                     [catalog.ratios_for("grad exclusive")
+                      for catalog in semester_catalogs]),
+                    ("Fall vs Spring -- Combined Grad/Undergrad Courses",
+                     [catalog.ratios_for("combined")
+                      for catalog in semester_catalogs]),
+                    ("Fall vs Spring -- All Courses",
+                     [catalog._ratios for catalog in semester_catalogs])],
+                   show,
+                   labels=semester_labels)
 
     return None
 